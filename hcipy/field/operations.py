@@ -531,7 +531,7 @@ def field_kron(a, b):
 	output_tensor_shape = np.array(aa.shape[:-1]) * np.array(bb.shape[:-1])
 	output_shape = np.concatenate((output_tensor_shape, [grid.size]))
 
-	res = (aa[:, np.newaxis, :, np.newaxis, :] * bb[np.newaxis, :, np.newaxis, :, :]).reshape(output_shape)
+	res = np.einsum('ij...,kl...->ikjl...', aa, bb).reshape(output_shape)
 
 	return Field(res, grid)
 
@@ -1,6 +1,7 @@
 from __future__ import division
 
 import numpy as np
+import scipy.fft
 from .fourier_transform import FourierTransform, multiplex_for_tensor_fields
 from ..field import Field, CartesianGrid, RegularCoords
 from ..config import Configuration
@@ -211,12 +212,11 @@ class FastFourierTransform(FourierTransform):
 			if self.shift_output is not None:
 				self.internal_array[self.cutout_input] *= self.shift_output.reshape(self.shape_in)
 
-		if not self.emulate_fftshifts:
-			self.internal_array = np.fft.ifftshift(self.internal_array)
-
-		fft_array = np.fft.fftn(self.internal_array)
-
-		if not self.emulate_fftshifts:
+		if self.emulate_fftshifts:
+			fft_array = scipy.fft.fftn(self.internal_array)
+		else:
+			# The shifted array is a temporary copy, so we can transform it in place.
+			fft_array = scipy.fft.fftn(np.fft.ifftshift(self.internal_array), overwrite_x=True)
 			fft_array = np.fft.fftshift(fft_array)
 
 		if self.cutout_output is None:
@@ -250,12 +250,11 @@ class FastFourierTransform(FourierTransform):
 			self.internal_array[self.cutout_output] = field.reshape(self.shape_out)
 			self.internal_array[self.cutout_output] /= self.shift_input.reshape(self.shape_out)
 
-		if not self.emulate_fftshifts:
-			self.internal_array = np.fft.ifftshift(self.internal_array)
-
-		fft_array = np.fft.ifftn(self.internal_array)
-
-		if not self.emulate_fftshifts:
+		if self.emulate_fftshifts:
+			fft_array = scipy.fft.ifftn(self.internal_array)
+		else:
+			# The shifted array is a temporary copy, so we can transform it in place.
+			fft_array = scipy.fft.ifftn(np.fft.ifftshift(self.internal_array), overwrite_x=True)
 			fft_array = np.fft.fftshift(fft_array)
 
 		if self.cutout_input is None:
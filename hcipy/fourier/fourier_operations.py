@@ -1,7 +1,8 @@
 import numpy as np
+import scipy.fft
 
 from .fast_fourier_transform import FastFourierTransform
-from ..field import Field, field_dot, field_conjugate_transpose
+from ..field import Field, field_dot
 
 class FourierFilter(object):
 	'''A filter in the Fourier domain.
@@ -34,6 +35,7 @@ class FourierFilter(object):
 		self.transfer_function = transfer_function
 
 		self._transfer_function = None
+		self._transfer_function_adjoint = None
 		self.internal_array = None
 
 	def _compute_functions(self, field):
@@ -45,11 +47,12 @@ class FourierFilter(object):
 
 			tf = np.fft.ifftshift(tf.shaped, axes=tuple(range(-self.input_grid.ndim, 0)))
 			self._transfer_function = tf.astype(field.dtype, copy=False)
+			self._transfer_function_adjoint = None
 
 		recompute_internal_array = self.internal_array is None
 		recompute_internal_array = recompute_internal_array or (self.internal_array.ndim != (field.grid.ndim + field.tensor_order))
 		recompute_internal_array = recompute_internal_array or (self.internal_array.dtype != field.dtype)
-		recompute_internal_array = recompute_internal_array or np.all(self.internal_array.shape[:field.tensor_order] == field.tensor_shape)
+		recompute_internal_array = recompute_internal_array or not np.array_equal(self.internal_array.shape[:field.tensor_order], field.tensor_shape)
 
 		if recompute_internal_array:
 			self.internal_array = self.internal_grid.zeros(field.tensor_shape, field.dtype).shaped
@@ -101,43 +104,55 @@ class FourierFilter(object):
 		'''
 		self._compute_functions(field)
 
+		if adjoint:
+			if self._transfer_function_adjoint is None:
+				# Cache the adjoint transfer function for subsequent backward filterings.
+				tf = self._transfer_function.conj()
+
+				if (tf.ndim - self.internal_grid.ndim) == 2:
+					tf = np.swapaxes(tf, 0, 1)
+
+				self._transfer_function_adjoint = tf
+
+			tf = self._transfer_function_adjoint
+		else:
+			tf = self._transfer_function
+
+		axes = tuple(range(-self.input_grid.ndim, 0))
+
 		if self.cutout is None:
-			f = field.shaped
+			f = scipy.fft.fftn(field.shaped, axes=axes)
 		else:
 			f = self.internal_array
 			f[:] = 0
 			c = tuple([slice(None)] * field.tensor_order) + self.cutout
 			f[c] = field.shaped
 
-		f = np.fft.fftn(f, axes=tuple(range(-self.input_grid.ndim, 0)))
+			# The internal array is refilled on every call, so we can transform it in place.
+			f = scipy.fft.fftn(f, axes=axes, overwrite_x=True)
 
-		if (self._transfer_function.ndim - self.internal_grid.ndim) == 2:
+		if (tf.ndim - self.internal_grid.ndim) == 2:
 			# The transfer function is a matrix field.
 			s1 = f.shape[:-self.internal_grid.ndim] + (self.internal_grid.size,)
 			f = Field(f.reshape(s1), self.internal_grid)
 
-			s2 = self._transfer_function.shape[:-self.internal_grid.ndim] + (self.internal_grid.size,)
-			tf = Field(self._transfer_function.reshape(s2), self.internal_grid)
-
-			if adjoint:
-				tf = field_conjugate_transpose(tf)
+			s2 = tf.shape[:-self.internal_grid.ndim] + (self.internal_grid.size,)
+			tf = Field(tf.reshape(s2), self.internal_grid)
 
 			f = field_dot(tf, f).shaped
 		else:
 			# The transfer function is a scalar field.
-			if adjoint:
-				tf = self._transfer_function.conj()
-			else:
-				tf = self._transfer_function
-
 			f *= tf
 
-		f = np.fft.ifftn(f, axes=tuple(range(-self.input_grid.ndim, 0)))
+		# The spectrum is either a freshly allocated array or our own internal array, so we can
+		# transform it in place.
+		f = scipy.fft.ifftn(f, axes=axes, overwrite_x=True)
 
 		s = f.shape[:-self.internal_grid.ndim] + (-1,)
 		if self.cutout is None:
 			res = f.reshape(s)
 		else:
-			res = f[c].reshape(s)
+			# Copy the cutout, as it would otherwise be overwritten by the next call.
+			res = np.array(f[c]).reshape(s)
 
 		return Field(res, self.input_grid)
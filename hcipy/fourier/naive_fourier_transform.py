@@ -79,7 +79,6 @@ class NaiveFourierTransform(FourierTransform):
 
 		return self._T_backward
 
-	@multiplex_for_tensor_fields
 	def forward(self, field):
 		'''Returns the forward Fourier transform of the :class:`Field` field.
 
@@ -94,13 +93,21 @@ class NaiveFourierTransform(FourierTransform):
 			The Fourier transform of the field.
 		'''
 		if self.precompute_matrices:
-			res = self.T_forward.dot(field.ravel())
+			# Transform all tensor elements at once with a single matrix-matrix product.
+			f = np.asarray(field).reshape((-1, self.input_grid.size))
+			res = f.dot(self.T_forward.T).reshape(field.shape[:-1] + (-1,))
+
+			return Field(res, self.output_grid).astype(field.dtype)
 		else:
-			res = np.array([(field * self.input_grid.weights).dot(np.exp(-1j * np.dot(p, self.coords_in))) for p in self.coords_out.T])
+			return self._forward_on_the_fly(field)
+
+	@multiplex_for_tensor_fields
+	def _forward_on_the_fly(self, field):
+		weighted_field = field * self.input_grid.weights
+		res = np.array([weighted_field.dot(np.exp(-1j * np.dot(p, self.coords_in))) for p in self.coords_out.T])
 
 		return Field(res, self.output_grid).astype(field.dtype)
 
-	@multiplex_for_tensor_fields
 	def backward(self, field):
 		'''Returns the inverse Fourier transform of the :class:`Field` field.
 
@@ -115,9 +122,18 @@ class NaiveFourierTransform(FourierTransform):
 			The inverse Fourier transform of the field.
 		'''
 		if self.precompute_matrices:
-			res = self.T_backward.dot(field.ravel())
+			# Transform all tensor elements at once with a single matrix-matrix product.
+			f = np.asarray(field).reshape((-1, self.output_grid.size))
+			res = f.dot(self.T_backward.T).reshape(field.shape[:-1] + (-1,))
+
+			return Field(res, self.input_grid).astype(field.dtype)
 		else:
-			res = np.array([(field * self.output_grid.weights).dot(np.exp(1j * np.dot(p, self.coords_out))) for p in self.coords_in.T])
-			res /= (2 * np.pi)**self.input_grid.ndim
+			return self._backward_on_the_fly(field)
+
+	@multiplex_for_tensor_fields
+	def _backward_on_the_fly(self, field):
+		weighted_field = field * self.output_grid.weights
+		res = np.array([weighted_field.dot(np.exp(1j * np.dot(p, self.coords_out))) for p in self.coords_in.T])
+		res /= (2 * np.pi)**self.input_grid.ndim
 
 		return Field(res, self.input_grid).astype(field.dtype)
@@ -270,7 +270,7 @@ class ModeBasis(object):
 		if self._transformation_matrix.ndim != 2:
 			raise NotImplementedError('The mode basis contains non-scalar fields; orthogonalization is not implemented for these.')
 
-		q, r = np.linalg.qr(self._transformation_matrix)
+		q, r = np.linalg.qr(self.to_dense().transformation_matrix)
 		return ModeBasis(q, self.grid)
 
 	def __getitem__(self, item):
@@ -336,7 +336,14 @@ class ModeBasis(object):
 		if self.is_sparse:
 			self._transformation_matrix = scipy.sparse.hstack((self._transformation_matrix, mode), 'csc')
 		else:
-			self._transformation_matrix = np.concatenate((self._transformation_matrix, [mode]), axis=-1)
+			# Copy the existing modes and the new mode into a single preallocated matrix.
+			T = self._transformation_matrix
+			transformation_matrix = np.empty(T.shape[:-1] + (T.shape[-1] + 1,), dtype=np.result_type(T, mode))
+
+			transformation_matrix[..., :-1] = T
+			transformation_matrix[..., -1] = mode
+
+			self._transformation_matrix = transformation_matrix
 
 	def extend(self, modes):
 		'''Extend the mode basis with `modes`.
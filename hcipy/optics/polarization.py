@@ -1,4 +1,5 @@
 import numpy as np
+import numexpr as ne
 
 from .wavefront import Wavefront, jones_to_mueller
 from .optical_element import OpticalElement, make_agnostic_forward, make_agnostic_backward, AgnosticOpticalElement
@@ -19,6 +20,54 @@ def rotation_matrix(angle):
 	'''
 	return np.array([[np.cos(angle),  np.sin(angle)],[-np.sin(angle), np.cos(angle)]])
 
+def _apply_jones_matrix(jones_matrix, electric_field):
+	'''Apply a Jones matrix to a vector or 2-tensor electric field.
+
+	Parameters
+	----------
+	jones_matrix : ndarray or tensor Field
+		The Jones matrix or Jones matrix field.
+	electric_field : Field
+		The electric field on which to act.
+
+	Returns
+	-------
+	Field
+		The transformed electric field.
+	'''
+	if not hasattr(jones_matrix, 'grid') and np.ndim(jones_matrix) == 2:
+		# A constant Jones matrix can be applied with a single matrix product.
+		is_real_product = np.isrealobj(jones_matrix) and np.iscomplexobj(electric_field)
+
+		if is_real_product and np.result_type(jones_matrix, electric_field) == electric_field.dtype and electric_field.flags.c_contiguous:
+			# Act on the real and imaginary parts at once by viewing the field as interleaved real numbers.
+			# This avoids casting the Jones matrix to complex and uses a real, instead of a complex, product.
+			# A higher precision Jones matrix would upcast the product, so it takes the general path below.
+			E = np.asarray(electric_field).view(electric_field.real.dtype)
+			res = np.tensordot(jones_matrix, E, axes=1).view(electric_field.dtype)
+		else:
+			res = np.tensordot(jones_matrix, electric_field, axes=1)
+
+		return Field(res, electric_field.grid)
+	elif hasattr(jones_matrix, 'grid') and jones_matrix.shape[:-1] == (2, 2) and electric_field.shape[0] == 2:
+		# Evaluate each output element in a single fused pass over all pixels.
+		res = np.empty(electric_field.shape, dtype=np.result_type(jones_matrix, electric_field))
+
+		for i in range(2):
+			for k in np.ndindex(*electric_field.shape[1:-1]):
+				variables = {
+					'a': jones_matrix[i, 0],
+					'b': jones_matrix[i, 1],
+					'x': electric_field[(0,) + k],
+					'y': electric_field[(1,) + k]
+				}
+
+				ne.evaluate('a * x + b * y', local_dict=variables, out=res[(i,) + k])
+
+		return Field(res, electric_field.grid)
+	else:
+		return field_dot(jones_matrix, electric_field)
+
 class JonesMatrixOpticalElement(AgnosticOpticalElement):
 	'''A general Jones Matrix.
 
@@ -65,7 +114,7 @@ class JonesMatrixOpticalElement(AgnosticOpticalElement):
 			return Wavefront(electric_field, wavelength=wavefront.wavelength, input_stokes_vector=[1, 0, 0, 0])
 		else:
 			wf = wavefront.copy()
-			wf.electric_field = field_dot(instance_data.jones_matrix, wf.electric_field)
+			wf.electric_field = _apply_jones_matrix(instance_data.jones_matrix, wf.electric_field)
 
 			return wf
 
@@ -93,7 +142,7 @@ class JonesMatrixOpticalElement(AgnosticOpticalElement):
 			return Wavefront(electric_field, wavelength=wavefront.wavelength, input_stokes_vector=[1, 0, 0, 0])
 		else:
 			wf = wavefront.copy()
-			wf.electric_field = field_dot(field_conjugate_transpose(instance_data.jones_matrix), wf.electric_field)
+			wf.electric_field = _apply_jones_matrix(field_conjugate_transpose(instance_data.jones_matrix), wf.electric_field)
 
 			return wf
 
@@ -141,19 +190,35 @@ class PhaseRetarder(JonesMatrixOpticalElement):
 	def jones_matrix(self):
 		def jones(phase_retardation, fast_axis_orientation, circularity):
 			phi_plus = np.exp(1j * phase_retardation / 2)
-			phi_minus = np.exp(-1j * phase_retardation / 2)
+			phi_minus = phi_plus.conjugate()
+			phi_diff = phi_plus - phi_minus
+
+			c = np.cos(fast_axis_orientation)
+			s = np.sin(fast_axis_orientation)
+			c2 = c * c
+			cs = c * s
+
+			circ_plus = np.exp(1j * circularity)
+			circ_minus = circ_plus.conjugate()
 
-			# calculating the individual components
-			j11 = phi_plus * np.cos(fast_axis_orientation)**2 + phi_minus * np.sin(fast_axis_orientation)**2
-			j12 = (phi_plus - phi_minus) * np.exp(-1j * circularity) * np.cos(fast_axis_orientation) * np.sin(fast_axis_orientation)
-			j21 = (phi_plus - phi_minus) * np.exp(1j * circularity) * np.cos(fast_axis_orientation) * np.sin(fast_axis_orientation)
-			j22 = phi_plus * np.sin(fast_axis_orientation)**2 + phi_minus * np.cos(fast_axis_orientation)**2
+			# Write the individual components directly into the Jones matrix. We use
+			# cos^2 + sin^2 = 1 to write the diagonal as phi_minus + phi_diff * cos^2 and
+			# phi_plus - phi_diff * cos^2.
+			shape = np.broadcast(phase_retardation, fast_axis_orientation, circularity).shape
+			jones_matrix = np.empty((2, 2) + shape, dtype='complex')
 
-			# constructing the Jones matrix.
-			jones_matrix = np.array([[j11, j12], [j21, j22]])
+			np.multiply(phi_diff, c2, out=jones_matrix[0, 0, ...])
+			np.subtract(phi_plus, jones_matrix[0, 0, ...], out=jones_matrix[1, 1, ...])
+			jones_matrix[0, 0, ...] += phi_minus
 
-			if hasattr(j11, 'grid'):
-				jones_matrix = Field(jones_matrix, j11.grid)
+			np.multiply(phi_diff, cs, out=jones_matrix[0, 1, ...])
+			np.multiply(jones_matrix[0, 1, ...], circ_plus, out=jones_matrix[1, 0, ...])
+			jones_matrix[0, 1, ...] *= circ_minus
+
+			for parameter in [phase_retardation, fast_axis_orientation, circularity]:
+				if hasattr(parameter, 'grid'):
+					jones_matrix = Field(jones_matrix, parameter.grid)
+					break
 
 			return jones_matrix
 
@@ -283,7 +348,18 @@ class LinearPolarizer(JonesMatrixOpticalElement):
 			c = np.cos(angle)
 			s = np.sin(angle)
 
-			return np.array([[c**2, c * s],[c * s, s**2]])
+			# Write the matrix elements directly into the Jones matrix to avoid temporaries.
+			jones_matrix = np.empty((2, 2) + c.shape, dtype=c.dtype)
+
+			np.multiply(c, c, out=jones_matrix[0, 0, ...])
+			np.multiply(c, s, out=jones_matrix[0, 1, ...])
+			np.multiply(s, s, out=jones_matrix[1, 1, ...])
+			jones_matrix[1, 0, ...] = jones_matrix[0, 1, ...]
+
+			if hasattr(angle, 'grid'):
+				jones_matrix = Field(jones_matrix, angle.grid)
+
+			return jones_matrix
 
 		return self.construct_function(jones, self.polarization_angle)
 
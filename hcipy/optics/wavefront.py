@@ -2,7 +2,7 @@ import copy
 import numpy as np
 import numexpr as ne
 
-from ..field import Field, field_dot, field_kron
+from ..field import Field, field_dot, field_einsum, field_kron
 
 _U_matrix = 1 / np.sqrt(2) * np.array([
 	[1, 0, 0, 1],
@@ -10,6 +10,15 @@ _U_matrix = 1 / np.sqrt(2) * np.array([
 	[0, 1, 1, 0],
 	[0, 1j, -1j, 0]])
 
+_U_matrix_H = np.ascontiguousarray(_U_matrix.conj().T)
+
+# Contraction order for 'ai,ij,jb->ab' in jones_to_mueller(): first U with kron(J, J*), then
+# the result with U^H. Both orders cost the same number of operations per pixel, so the choice
+# does not depend on the number of pixels, and the trailing grid index that field_einsum() adds
+# to Field operands does not change it either. We precompute it here instead of letting
+# np.einsum() search for it on every call.
+_jones_to_mueller_path = ['einsum_path', (0, 1), (0, 1)]
+
 # TODO Should add a pilot Gaussian beam with each Wavefront
 
 class Wavefront(object):
@@ -355,4 +364,10 @@ def jones_to_mueller(jones_matrix):
 	ndarray or tensor Field
 		The Mueller matrix/matrices.
 	'''
-	return np.real(field_dot(_U_matrix, field_dot(field_kron(jones_matrix, jones_matrix.conj()), _U_matrix.conj().T)))
+	kron = field_kron(jones_matrix, jones_matrix.conj())
+
+	if hasattr(kron, 'grid'):
+		# Apply both U and U^H in a single pass over the pixels.
+		return np.real(field_einsum('ai,ij,jb->ab', _U_matrix, kron, _U_matrix_H, optimize=_jones_to_mueller_path))
+	else:
+		return np.real(_U_matrix.dot(kron).dot(_U_matrix_H))
@@ -20,7 +20,7 @@ setup(name='hcipy',
 		'setuptools_scm'],
 	install_requires=[
 		"numpy",
-		"scipy",
+		"scipy>=1.4",
 		"matplotlib>=2.0.0",
 		"Pillow",
 		"pyyaml",
@@ -120,6 +120,24 @@ def test_mft_precomputations():
 			assert (mft.M1 is not None) == precompute_matrices
 			assert (mft.intermediate_array is not None) == allocate_intermediate
 
+def test_nft_tensor_fields():
+	input_grid = make_pupil_grid(16)
+	output_grid = make_fft_grid(input_grid, 2, 0.5)
+
+	nft1 = NaiveFourierTransform(input_grid, output_grid, precompute_matrices=True)
+	nft2 = NaiveFourierTransform(input_grid, output_grid, precompute_matrices=False)
+
+	for tensor_shape in [(), (2,), (2, 3)]:
+		f_shape = tensor_shape + (input_grid.size,)
+		f_in = Field(np.random.randn(*f_shape) + 1j * np.random.randn(*f_shape), input_grid)
+
+		f_out_1 = nft1.forward(f_in)
+		f_out_2 = nft2.forward(f_in)
+
+		assert f_out_1.shape == tensor_shape + (output_grid.size,)
+		assert np.allclose(f_out_1, f_out_2)
+		assert np.allclose(nft1.backward(f_out_1), nft2.backward(f_out_2))
+
 def test_fourier_filter():
 	for n in [16, 17, [16, 17]]:
 		for q in [1, 2, 3]:
@@ -157,3 +175,42 @@ def test_fourier_filter():
 
 					assert np.allclose(f_out_fft, f_out_ff)
 					assert np.allclose(f_in_fft, f_in_ff)
+
+def test_fourier_filter_internal_array():
+	input_grid = make_pupil_grid(16)
+
+	fft = FastFourierTransform(input_grid, 2)
+	transfer_function = Field(np.exp(1j * fft.output_grid.x), fft.output_grid)
+
+	fourier_filter = FourierFilter(input_grid, transfer_function, 2)
+
+	f_scalar = Field(np.random.randn(input_grid.size) + 0j, input_grid)
+	f_vector = Field(np.random.randn(2, input_grid.size) + 0j, input_grid)
+
+	# The zeropadded array should be reused between calls on similar fields.
+	fourier_filter.forward(f_scalar)
+	internal_array = fourier_filter.internal_array
+
+	fourier_filter.backward(f_scalar)
+	assert fourier_filter.internal_array is internal_array
+
+	# And reallocated when the tensor shape changes.
+	f_out = fourier_filter.forward(f_vector)
+	assert fourier_filter.internal_array is not internal_array
+	assert fourier_filter.internal_array.shape[0] == 2
+
+	assert np.allclose(f_out[0], fourier_filter.forward(f_vector[0]))
+
+	# The output should not share memory with the internal array, so it should survive the next call.
+	input_grid = make_uniform_grid(64, 1)
+
+	fft = FastFourierTransform(input_grid, 2)
+	transfer_function = Field(np.exp(1j * fft.output_grid.x), fft.output_grid)
+
+	fourier_filter = FourierFilter(input_grid, transfer_function, 2)
+
+	f_out_1 = fourier_filter.forward(Field(np.random.randn(input_grid.size) + 0j, input_grid))
+	f_out_1_copy = f_out_1.copy()
+
+	fourier_filter.forward(Field(np.random.randn(input_grid.size) + 0j, input_grid))
+	assert np.array_equal(f_out_1, f_out_1_copy)
@@ -89,6 +89,30 @@ def test_sparse_mode_basis():
 	assert np.allclose(mode_basis_1.transformation_matrix, mode_basis_5.transformation_matrix)
 	assert not scipy.sparse.issparse(mode_basis_5.transformation_matrix)
 
+def test_mode_basis_append():
+	grid = make_pupil_grid(16)
+
+	mode_basis = ModeBasis([grid.ones(), grid.x])
+	mode_basis.append(grid.y)
+
+	assert mode_basis.num_modes == 3
+	assert np.allclose(mode_basis[2], grid.y)
+	assert np.allclose(mode_basis.transformation_matrix[:, :2], np.array([grid.ones(), grid.x]).T)
+
+def test_mode_basis_orthogonalization():
+	grid = make_pupil_grid(16)
+
+	mode_basis = ModeBasis([grid.ones(), grid.x, grid.y])
+
+	for basis in [mode_basis, mode_basis.to_sparse()]:
+		orthogonalized = basis.orthogonalized
+
+		assert orthogonalized.is_dense
+		assert orthogonalized.num_modes == 3
+
+		T = orthogonalized.transformation_matrix
+		assert np.allclose(T.T.dot(T), np.eye(3))
+
 def test_gaussian_laguerre_modes():
 	grid = make_focal_grid(32, 4)
 
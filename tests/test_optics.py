@@ -550,6 +550,20 @@ def test_polarization_elements():
 		# Test power conservation.
 		assert np.allclose(test_wf.I, wf_forward_circ_polarizer_1.I + wf_forward_circ_polarizer_2.I)
 
+def test_spatially_varying_polarizer():
+	grid = make_pupil_grid(8)
+	angles = Field(np.random.uniform(-np.pi, np.pi, grid.size), grid)
+
+	polarizer = LinearPolarizer(angles)
+	assert hasattr(polarizer.jones_matrix, 'grid')
+
+	electric_field = Field(np.random.randn(2, grid.size) + 1j * np.random.randn(2, grid.size), grid)
+	wf_out = polarizer.forward(Wavefront(electric_field))
+
+	for i in range(grid.size):
+		reference = np.dot(LinearPolarizer(angles[i]).jones_matrix, electric_field[:, i])
+		assert np.allclose(wf_out.electric_field[:, i], reference)
+
 def test_magnifier():
 	pupil_grid = make_pupil_grid(128)
 	wf = Wavefront(circular_aperture(1)(pupil_grid))